@@ -3,6 +3,7 @@ Configuration module for Mars Explorer Hub.
 Handles API keys and application settings.
 """
 
+import functools
 import os
 from typing import Optional
 
@@ -21,16 +22,20 @@ except ImportError:
     pass
 
 
+@functools.lru_cache(maxsize=1)
 def get_nasa_api_key() -> str:
     """
     Retrieve NASA API key from multiple sources in order of precedence:
     1. Streamlit secrets (for Streamlit Cloud deployment)
     2. Environment variables (for local development)
     3. Raise error if not found
-    
+
+    The result is memoized: probing st.secrets stats and parses
+    secrets.toml, which is wasted I/O on every rerun after the first.
+
     Returns:
         str: NASA API key
-        
+
     Raises:
         ValueError: If API key is not found in any source
     """
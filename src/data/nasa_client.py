@@ -3,9 +3,16 @@ NASA API client for Mars Explorer Hub.
 Handles all interactions with NASA's Mars data APIs.
 """
 
+import functools
+import re
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import streamlit as st
 import pandas as pd
+import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 from io import BytesIO
@@ -13,6 +20,69 @@ from PIL import Image
 
 import config
 
+# Prefer orjson for decoding the multi-megabyte manifest/sol payloads;
+# fall back to stdlib json when it is not installed
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# On-disk HTTP cache survives Streamlit Cloud restarts, unlike
+# st.cache_data; fall back to a plain session when not installed
+try:
+    import requests_cache
+    HAS_REQUESTS_CACHE = True
+except ImportError:
+    HAS_REQUESTS_CACHE = False
+
+
+# Common MSL camera mappings (instrument code -> readable name)
+_CAMERA_MAP = {
+    'NAV_LEFT': 'Navigation Camera - Left',
+    'NAV_RIGHT': 'Navigation Camera - Right',
+    'NAV_LEFT_B': 'Navigation Camera - Left B',
+    'NAV_RIGHT_B': 'Navigation Camera - Right B',
+    'FHAZ_LEFT': 'Front Hazard Avoidance Camera - Left',
+    'FHAZ_RIGHT': 'Front Hazard Avoidance Camera - Right',
+    'RHAZ_LEFT': 'Rear Hazard Avoidance Camera - Left',
+    'RHAZ_RIGHT': 'Rear Hazard Avoidance Camera - Right',
+    'MAST_LEFT': 'Mast Camera - Left',
+    'MAST_RIGHT': 'Mast Camera - Right',
+    'MAHLI': 'Mars Hand Lens Imager',
+    'MARDI': 'Mars Descent Imager',
+    'CHEMCAM': 'Chemistry and Camera Complex'
+}
+
+# Single alternation regex for prefix matching, longest-first so e.g.
+# 'NAV_LEFT_B' wins over 'NAV_LEFT'
+_CAMERA_RE = re.compile(
+    '^(' + '|'.join(re.escape(key) for key in sorted(_CAMERA_MAP, key=len, reverse=True)) + ')'
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _format_camera_name(instrument: str) -> str:
+    """
+    Convert MSL instrument codes to readable camera names.
+
+    Instrument codes repeat heavily within a sol, so results are memoized
+    to avoid rescanning the prefix table per photo.
+
+    Args:
+        instrument: Instrument code (e.g., 'NAV_RIGHT_B', 'MAST_LEFT')
+
+    Returns:
+        Human-readable camera name
+    """
+    # One C-level regex match covers both exact and prefix lookups
+    match = _CAMERA_RE.match(instrument)
+    if match:
+        return _CAMERA_MAP[match.group(1)]
+
+    # Default: return cleaned up instrument name
+    return instrument.replace('_', ' ').title()
+
 
 class NASAClient:
     """Client for interacting with NASA Mars APIs."""
@@ -20,8 +90,35 @@ class NASAClient:
     def __init__(self):
         """Initialize the NASA API client with API key."""
         self.api_key = config.get_nasa_api_key()
-        self.session = requests.Session()
+        if HAS_REQUESTS_CACHE:
+            # cache_control=True honours NASA's cache headers and enables
+            # conditional (ETag/Last-Modified) revalidation
+            self.session = requests_cache.CachedSession(
+                cache_name='.nasa_cache',
+                backend='sqlite',
+                expire_after=config.CACHE_TTL_SECONDS,
+                cache_control=True
+            )
+        else:
+            self.session = requests.Session()
         self.session.params = {'api_key': self.api_key}
+
+        # Pool connections and retry transient failures so repeated API
+        # calls reuse one TLS connection instead of renegotiating per request
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(429, 500, 502, 503, 504)
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.headers.update({
+            'Accept-Encoding': 'gzip, deflate',
+            'User-Agent': 'MarsExplorerHub/1.0'
+        })
     
     def _make_request(self, url: str, params: Optional[Dict] = None, timeout: int = 10) -> Optional[Dict]:
         """
@@ -38,6 +135,8 @@ class NASAClient:
         try:
             response = self.session.get(url, params=params, timeout=timeout)
             response.raise_for_status()
+            if HAS_ORJSON:
+                return orjson.loads(response.content)
             return response.json()
         except requests.exceptions.Timeout:
             st.error("⏱️ Request timeout - NASA servers might be slow. Please try again.")
@@ -71,51 +170,67 @@ class NASAClient:
         if not data:
             return None
         
-        # InSight API returns data in a nested structure
-        # Extract Sol data (skip metadata keys)
-        sol_keys = [key for key in data.keys() if key.isdigit()]
+        # The InSight payload ships its own sol-key list; fall back to
+        # scanning top-level keys if the feed ever drops it
+        sol_keys = data.get('sol_keys') or [key for key in data.keys() if key.isdigit()]
         
         if not sol_keys:
             st.warning("⚠️ No weather data available. InSight mission ended in December 2022.")
             return None
-        
-        # Parse weather data into structured format
-        weather_records = []
-        for sol in sol_keys:
-            sol_data = data[sol]
-            
-            # Extract temperature data (if available)
-            temp_data = sol_data.get('AT', {})
-            min_temp = temp_data.get('mn')
-            max_temp = temp_data.get('mx')
-            avg_temp = temp_data.get('av')
-            
-            # Extract pressure data (if available)
-            pressure_data = sol_data.get('PRE', {})
-            avg_pressure = pressure_data.get('av')
-            
-            # Get season
-            season = sol_data.get('Season', 'Unknown')
-            
-            # Get Earth date
-            first_utc = sol_data.get('First_UTC')
-            
-            weather_records.append({
-                'sol': int(sol),
-                'min_temp_c': min_temp,
-                'max_temp_c': max_temp,
-                'avg_temp_c': avg_temp,
-                'pressure_pa': avg_pressure,
-                'season': season,
-                'earth_date': first_utc
-            })
-        
-        # Convert to DataFrame and sort by Sol
-        df = pd.DataFrame(weather_records)
-        df = df.sort_values('sol', ascending=False)
-        
-        return df
+
+        # Sort the small key list up front (most recent first) so the
+        # DataFrame is born in order and never needs a full sort_values
+        sol_keys = sorted(sol_keys, key=int, reverse=True)
+
+        # Flatten all sol records in one vectorized pass instead of a
+        # per-sol Python loop (reindex tolerates fields missing from the feed)
+        records = [data[key] for key in sol_keys]
+        df = pd.json_normalize(records, sep='_').reindex(
+            columns=['AT_mn', 'AT_mx', 'AT_av', 'PRE_av', 'Season', 'First_UTC']
+        )
+        df.rename(columns={
+            'AT_mn': 'min_temp_c',
+            'AT_mx': 'max_temp_c',
+            'AT_av': 'avg_temp_c',
+            'PRE_av': 'pressure_pa',
+            'Season': 'season',
+            'First_UTC': 'earth_date'
+        }, inplace=True)
+        df['season'] = df['season'].fillna('Unknown')
+        df['sol'] = np.asarray(sol_keys, dtype=np.int32)
+
+        return df[['sol', 'min_temp_c', 'max_temp_c', 'avg_temp_c',
+                   'pressure_pa', 'season', 'earth_date']]
     
+    @st.cache_resource(ttl=config.CACHE_TTL_SECONDS, show_spinner=False)
+    def _get_latest_msl_sol(_self) -> Optional[int]:
+        """
+        Fetch the MSL manifest and return the most recent sol with images.
+
+        Cached once per process: the manifest does not depend on any photo
+        query argument, so it should not be re-downloaded when those change.
+
+        Returns:
+            Latest sol number with images, or None if unavailable
+        """
+        manifest_data = _self._make_request(config.MSL_MANIFEST_URL)
+
+        if not manifest_data:
+            st.error("❌ Could not retrieve Curiosity rover manifest")
+            return None
+
+        sols = manifest_data.get('sols', [])
+        if not sols:
+            st.warning("⚠️ No image data available in manifest")
+            return None
+
+        # Find the most recent sol with images (iterate backwards)
+        for sol_info in reversed(sols):
+            if sol_info.get('num_images', 0) > 0:
+                return sol_info['sol']
+
+        return None
+
     @st.cache_data(ttl=config.CACHE_TTL_SECONDS, show_spinner=False)
     def get_rover_photos(_self, rover_name: str, num_photos: int = 5) -> Optional[List[Dict]]:
         """
@@ -139,34 +254,36 @@ class NASAClient:
             st.warning(f"⚠️ {rover_name.title()} rover is not currently available. Only Curiosity rover is supported.")
             return None
         
-        # Fetch MSL manifest to get latest sol
-        manifest_data = _self._make_request(config.MSL_MANIFEST_URL)
-        
-        if not manifest_data:
-            st.error("❌ Could not retrieve Curiosity rover manifest")
-            return None
-        
-        # Get the latest sol with images
-        sols = manifest_data.get('sols', [])
-        if not sols:
-            st.warning("⚠️ No image data available in manifest")
-            return None
-        
-        # Find the most recent sol with images (iterate backwards)
-        latest_sol = None
-        for sol_info in reversed(sols):
-            if sol_info.get('num_images', 0) > 0:
-                latest_sol = sol_info['sol']
-                break
-        
+        # On a cold cache the manifest and sol-images fetches are two
+        # sequential round-trips. When a previous run recorded the latest
+        # sol, speculatively fetch its images in parallel with the
+        # manifest check and keep the result if the sol is unchanged.
+        last_known_sol = st.session_state.get('msl_last_known_sol')
+        sol_data = None
+
+        if last_known_sol is not None:
+            speculative_url = config.MSL_SOL_IMAGES_URL_TEMPLATE.format(sol=last_known_sol)
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                speculative = executor.submit(_self._make_request, speculative_url)
+                # The manifest is independent of num_photos, so it is cached
+                # separately — tweaking photo count never re-downloads it
+                latest_sol = _self._get_latest_msl_sol()
+                if latest_sol == last_known_sol:
+                    sol_data = speculative.result()
+        else:
+            latest_sol = _self._get_latest_msl_sol()
+
         if latest_sol is None:
             st.warning("⚠️ No recent photos found for Curiosity")
             return None
-        
-        # Fetch images for the latest sol
-        sol_images_url = config.MSL_SOL_IMAGES_URL_TEMPLATE.format(sol=latest_sol)
-        sol_data = _self._make_request(sol_images_url)
-        
+
+        st.session_state['msl_last_known_sol'] = latest_sol
+
+        # Fetch images for the latest sol (skipped if the speculative fetch hit)
+        if sol_data is None:
+            sol_images_url = config.MSL_SOL_IMAGES_URL_TEMPLATE.format(sol=latest_sol)
+            sol_data = _self._make_request(sol_images_url)
+
         if not sol_data or 'images' not in sol_data:
             st.error(f"❌ Could not retrieve images for Sol {latest_sol}")
             return None
@@ -177,105 +294,86 @@ class NASAClient:
             st.warning(f"⚠️ No images found for Sol {latest_sol}")
             return None
         
-        # Format photo data to match expected structure
-        formatted_photos = []
-        for img in images:
-            # Extract URL - the urlList field contains the full image URL
-            img_url = img.get('urlList', '')
-            
-            # Parse UTC timestamp to extract date
-            utc_timestamp = img.get('utc', '')
-            earth_date = utc_timestamp.split('T')[0] if 'T' in utc_timestamp else utc_timestamp
-            
-            # Map instrument name to camera name
-            instrument = img.get('instrument', 'Unknown')
-            camera_name = _self._format_camera_name(instrument)
-            
-            formatted_photos.append({
-                'id': img.get('itemName', 'unknown'),
-                'img_src': img_url,
-                'camera_name': camera_name,
-                'camera_abbr': instrument,
-                'sol': int(img.get('sol', latest_sol)),
-                'earth_date': earth_date,
-                'rover': 'Curiosity'
-            })
-        
-        return formatted_photos
+        # Format photo data to match expected structure; vectorized string
+        # ops replace the per-image Python field juggling
+        photo_df = pd.DataFrame(images).reindex(
+            columns=['itemName', 'urlList', 'instrument', 'sol', 'utc']
+        )
+        instruments = photo_df['instrument'].fillna('Unknown')
+        formatted = pd.DataFrame({
+            'id': photo_df['itemName'].fillna('unknown'),
+            'img_src': photo_df['urlList'].fillna(''),
+            'camera_name': instruments.map(_format_camera_name),
+            'camera_abbr': instruments,
+            'sol': photo_df['sol'].fillna(latest_sol).astype('int32'),
+            # Drop the time component of the UTC timestamp in one pass
+            'earth_date': photo_df['utc'].fillna('').str.split('T', n=1).str[0],
+            'rover': 'Curiosity'
+        })
+
+        return formatted.to_dict('records')
     
-    def _format_camera_name(self, instrument: str) -> str:
+    @st.cache_data(ttl=config.CACHE_TTL_SECONDS, show_spinner=False)
+    def load_image_from_url(_self, url: str, max_size: Tuple[int, int] = (512, 512)) -> Optional[Image.Image]:
         """
-        Convert MSL instrument codes to readable camera names.
-        
+        Load an image from a URL, downscaled to thumbnail size.
+
+        Gallery cells never render at native resolution, so decoding and
+        caching full-size frames just wastes CPU and cache memory. Use
+        load_image_full_from_url when the original resolution is needed.
+
         Args:
-            instrument: Instrument code (e.g., 'NAV_RIGHT_B', 'MAST_LEFT')
-            
+            url: Image URL
+            max_size: Maximum (width, height) of the returned thumbnail
+
         Returns:
-            Human-readable camera name
+            PIL Image object or None if loading failed
         """
-        # Common MSL camera mappings
-        camera_map = {
-            'NAV_LEFT': 'Navigation Camera - Left',
-            'NAV_RIGHT': 'Navigation Camera - Right',
-            'NAV_LEFT_B': 'Navigation Camera - Left B',
-            'NAV_RIGHT_B': 'Navigation Camera - Right B',
-            'FHAZ_LEFT': 'Front Hazard Avoidance Camera - Left',
-            'FHAZ_RIGHT': 'Front Hazard Avoidance Camera - Right',
-            'RHAZ_LEFT': 'Rear Hazard Avoidance Camera - Left',
-            'RHAZ_RIGHT': 'Rear Hazard Avoidance Camera - Right',
-            'MAST_LEFT': 'Mast Camera - Left',
-            'MAST_RIGHT': 'Mast Camera - Right',
-            'MAHLI': 'Mars Hand Lens Imager',
-            'MARDI': 'Mars Descent Imager',
-            'CHEMCAM': 'Chemistry and Camera Complex'
-        }
-        
-        # Try exact match first
-        if instrument in camera_map:
-            return camera_map[instrument]
-        
-        # Try partial matches (e.g., 'NAV_RIGHT_B' -> 'Navigation Camera')
-        for key, value in camera_map.items():
-            if instrument.startswith(key):
-                return value
-        
-        # Default: return cleaned up instrument name
-        return instrument.replace('_', ' ').title()
-    
+        try:
+            response = _self.session.get(url, timeout=10)
+            response.raise_for_status()
+            img = Image.open(BytesIO(response.content))
+            # draft() lets JPEG decode at reduced scale straight from the DCT
+            img.draft('RGB', max_size)
+            img.thumbnail(max_size, Image.Resampling.LANCZOS)
+            img.load()  # force decode inside the cached call
+            return img
+        except Exception as e:
+            st.warning(f"⚠️ Could not load image: {str(e)}")
+            return None
+
     @st.cache_data(ttl=config.CACHE_TTL_SECONDS, show_spinner=False)
-    def load_image_from_url(_self, url: str) -> Optional[Image.Image]:
+    def load_image_full_from_url(_self, url: str) -> Optional[Image.Image]:
         """
-        Load an image from a URL.
-        
+        Load an image from a URL at its native resolution.
+
         Args:
             url: Image URL
-            
+
         Returns:
             PIL Image object or None if loading failed
         """
         try:
-            response = requests.get(url, timeout=10)
+            response = _self.session.get(url, timeout=10)
             response.raise_for_status()
             img = Image.open(BytesIO(response.content))
+            img.load()
             return img
         except Exception as e:
             st.warning(f"⚠️ Could not load image: {str(e)}")
             return None
 
 
-# Singleton instance (lazy initialization)
-_nasa_client_instance = None
-
-
+@st.cache_resource(show_spinner=False)
 def get_nasa_client() -> NASAClient:
     """
-    Get the singleton NASAClient instance.
-    Uses lazy initialization to ensure Streamlit secrets are loaded first.
-    
+    Get the shared NASAClient instance.
+
+    st.cache_resource shares one client (and its pooled HTTP session)
+    across all sessions and reruns, and stays lazy so Streamlit secrets
+    are loaded before the first construction.
+
     Returns:
         NASAClient: The NASA API client instance
     """
-    global _nasa_client_instance
-    if _nasa_client_instance is None:
-        _nasa_client_instance = NASAClient()
-    return _nasa_client_instance
+    return NASAClient()
@@ -7,8 +7,17 @@ import pandas as pd
 import plotly.graph_objects as go
 from typing import Optional
 
+# Optional dynamic-aggregation wrapper (LTTB downsampling) so the chart
+# stays O(pixels) if MAX_SOLS_FOR_CHART ever spans thousands of sols
+try:
+    from plotly_resampler import FigureResampler
+    HAS_RESAMPLER = True
+except ImportError:
+    HAS_RESAMPLER = False
+
 from src.utils.helpers import (
     celsius_to_fahrenheit,
+    celsius_to_fahrenheit_array,
     format_temperature,
     format_pressure,
     format_sol,
@@ -30,16 +39,12 @@ def render_weather_metrics(weather_df: Optional[pd.DataFrame], temp_unit: str =
         st.info("ℹ️ Displaying historical Mars weather data from the InSight lander.")
         return
     
-    # Get the latest sol data
-    latest = weather_df.iloc[0]
-    
-    # Extract values
-    sol = latest['sol']
-    avg_temp_c = latest.get('avg_temp_c')
-    min_temp_c = latest.get('min_temp_c')
-    max_temp_c = latest.get('max_temp_c')
-    pressure = latest.get('pressure_pa')
-    season = latest.get('season', 'Unknown')
+    # Extract the latest sol's values in one row-tuple unpack instead of
+    # seven boxed Series lookups
+    sol, avg_temp_c, min_temp_c, max_temp_c, pressure, season = next(
+        weather_df[['sol', 'avg_temp_c', 'min_temp_c', 'max_temp_c',
+                    'pressure_pa', 'season']].itertuples(index=False)
+    )
     
     # Convert temperatures if needed
     if temp_unit == "F":
@@ -106,20 +111,22 @@ def render_temperature_chart(weather_df: Optional[pd.DataFrame], temp_unit: str
     chart_data = weather_df.head(config.MAX_SOLS_FOR_CHART).copy()
     chart_data = chart_data.sort_values('sol')  # Sort ascending for chart
     
-    # Prepare temperature data
+    # Prepare temperature data (vectorized conversion; NaN propagates natively)
+    temp_cols = ['avg_temp_c', 'min_temp_c', 'max_temp_c']
     if temp_unit == "F":
-        chart_data['avg_temp'] = chart_data['avg_temp_c'].apply(celsius_to_fahrenheit)
-        chart_data['min_temp'] = chart_data['min_temp_c'].apply(celsius_to_fahrenheit)
-        chart_data['max_temp'] = chart_data['max_temp_c'].apply(celsius_to_fahrenheit)
+        chart_data[['avg_temp', 'min_temp', 'max_temp']] = (
+            celsius_to_fahrenheit_array(chart_data[temp_cols].to_numpy())
+        )
         temp_label = "Temperature (°F)"
     else:
-        chart_data['avg_temp'] = chart_data['avg_temp_c']
-        chart_data['min_temp'] = chart_data['min_temp_c']
-        chart_data['max_temp'] = chart_data['max_temp_c']
+        chart_data[['avg_temp', 'min_temp', 'max_temp']] = chart_data[temp_cols]
         temp_label = "Temperature (°C)"
     
-    # Create Plotly figure
-    fig = go.Figure()
+    # Create Plotly figure (resampler caps rendered points at ~1000/trace)
+    if HAS_RESAMPLER:
+        fig = FigureResampler(go.Figure(), default_n_shown_samples=1000)
+    else:
+        fig = go.Figure()
     
     # Add temperature range as filled area
     fig.add_trace(go.Scatter(
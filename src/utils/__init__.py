@@ -1,6 +1,7 @@
 """Utils module."""
 from .helpers import (
     celsius_to_fahrenheit,
+    celsius_to_fahrenheit_array,
     fahrenheit_to_celsius,
     format_temperature,
     format_pressure,
@@ -10,6 +11,7 @@ from .helpers import (
 
 __all__ = [
     'celsius_to_fahrenheit',
+    'celsius_to_fahrenheit_array',
     'fahrenheit_to_celsius',
     'format_temperature',
     'format_pressure',
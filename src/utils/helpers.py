@@ -2,22 +2,50 @@
 Utility functions for Mars Explorer Hub.
 """
 
+from bisect import bisect_left
 from typing import Optional
 
+# Mars temperatures typically range from -125°C to 20°C; colors are
+# indexed by the band the temperature falls into (coldest first)
+_TEMP_THRESHOLDS = (-80.0, -40.0, 0.0)
+_TEMP_COLORS = (
+    "#B8E6F0",  # Light blue for very cold
+    "#4A90E2",  # Blue
+    "#4ECDC4",  # Teal
+    "#FF6B35"   # Warm orange
+)
+
 
 def celsius_to_fahrenheit(celsius: Optional[float]) -> Optional[float]:
     """
     Convert temperature from Celsius to Fahrenheit.
-    
+
     Args:
         celsius: Temperature in Celsius
-        
+
     Returns:
         Temperature in Fahrenheit or None if input is None
     """
     if celsius is None:
         return None
-    return (celsius * 9/5) + 32
+    # Float literals avoid re-evaluating 9/5 on every call
+    return celsius * 1.8 + 32.0
+
+
+def celsius_to_fahrenheit_array(celsius):
+    """
+    Convert an array or Series of Celsius temperatures to Fahrenheit.
+
+    Vectorized counterpart of celsius_to_fahrenheit: one ufunc pass over
+    the whole array, with NaN propagating in place of the None guard.
+
+    Args:
+        celsius: Array-like of temperatures in Celsius
+
+    Returns:
+        Array-like of temperatures in Fahrenheit
+    """
+    return celsius * 1.8 + 32.0
 
 
 def fahrenheit_to_celsius(fahrenheit: Optional[float]) -> Optional[float]:
@@ -95,13 +123,5 @@ def get_temperature_color(temp_c: Optional[float]) -> str:
     """
     if temp_c is None:
         return "#888888"  # Gray for N/A
-    
-    # Mars temperatures typically range from -125°C to 20°C
-    if temp_c > 0:
-        return "#FF6B35"  # Warm orange
-    elif temp_c > -40:
-        return "#4ECDC4"  # Teal
-    elif temp_c > -80:
-        return "#4A90E2"  # Blue
-    else:
-        return "#B8E6F0"  # Light blue for very cold
+
+    return _TEMP_COLORS[bisect_left(_TEMP_THRESHOLDS, temp_c)]
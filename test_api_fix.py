@@ -4,6 +4,8 @@ Quick test to verify the NASA API fix works.
 """
 import requests
 
+from probe_utils import json_loads
+
 API_KEY = "Whrc0fN97eqwSdCGpdgA4O9PVhvVVbBh3H3aMJtW"
 ROVER = "curiosity"
 
@@ -23,7 +25,7 @@ try:
     print(f"📊 Status Code: {response.status_code}")
     
     if response.status_code == 200:
-        data = response.json()
+        data = json_loads(response.content)
         
         if 'latest_photos' in data:
             photos = data['latest_photos']
@@ -2,8 +2,58 @@
 """
 Test the discovered mars.nasa.gov JSON endpoints for MSL (Curiosity) images.
 """
-import requests
-import json
+from collections import deque
+
+from probe_utils import SESSION, json_loads
+from test_urls import MARS2020_CANDIDATES, MSL_MANIFEST
+
+# Streaming parser keeps peak memory at one event instead of the whole
+# multi-MB manifest; prefer the C backend, fall back to full json.loads
+try:
+    import ijson.backends.yajl2_c as ijson
+except ImportError:
+    try:
+        import ijson
+    except ImportError:
+        ijson = None
+
+
+def summarize_manifest(response):
+    """
+    Pull the header fields, sol count, and last 5 sols from the manifest
+    without materializing the full 'sols' list.
+
+    Returns:
+        (summary, total_sols, last_sols) tuple
+    """
+    if ijson is None:
+        manifest = json_loads(response.content)
+        sols = manifest.get('sols', [])
+        summary = {key: manifest.get(key)
+                   for key in ('latest_sol', 'num_images', 'most_recent')}
+        return summary, len(sols), sols[-5:]
+
+    response.raw.decode_content = True  # transparently un-gzip the stream
+    summary = {}
+    total_sols = 0
+    last_sols = deque(maxlen=5)
+    current = None
+
+    for prefix, event, value in ijson.parse(response.raw):
+        if prefix in ('latest_sol', 'num_images', 'most_recent'):
+            summary[prefix] = value
+        elif prefix == 'sols.item':
+            if event == 'start_map':
+                current = {}
+            elif event == 'end_map':
+                total_sols += 1
+                last_sols.append(current)
+                current = None
+        elif current is not None and prefix.startswith('sols.item.'):
+            current[prefix[len('sols.item.'):]] = value
+
+    return summary, total_sols, list(last_sols)
+
 
 print("🎉 Testing Discovered JSON API Endpoints")
 print("=" * 70)
@@ -11,21 +61,20 @@ print()
 
 # Test MSL manifest
 print("1️⃣ Testing MSL Manifest...")
-manifest_url = "https://mars.nasa.gov/msl-raw-images/image/image_manifest.json"
+manifest_url = MSL_MANIFEST
 
 try:
-    response = requests.get(manifest_url, timeout=10)
+    response = SESSION.get(manifest_url, timeout=10, stream=True)
     if response.status_code == 200:
-        manifest = response.json()
+        summary, total_sols, latest_sols = summarize_manifest(response)
         print(f"✅ MSL Manifest loaded successfully!")
-        print(f"Latest Sol: {manifest['latest_sol']}")
-        print(f"Total Images: {manifest['num_images']:,}")
-        print(f"Most Recent: {manifest['most_recent']}")
-        print(f"Total Sols with data: {len(manifest['sols'])}")
+        print(f"Latest Sol: {summary.get('latest_sol')}")
+        print(f"Total Images: {summary.get('num_images', 0):,}")
+        print(f"Most Recent: {summary.get('most_recent')}")
+        print(f"Total Sols with data: {total_sols}")
         print()
-        
+
         # Get the latest sol with images
-        latest_sols = manifest['sols'][-5:]  # Last 5 sols
         print("Last 5 sols:")
         for sol_info in latest_sols:
             print(f"  Sol {sol_info['sol']}: {sol_info['num_images']} images - {sol_info['catalog_url']}")
@@ -38,11 +87,11 @@ try:
             print(f"URL: {test_sol['catalog_url']}")
             print()
             
-            sol_response = requests.get(test_sol['catalog_url'], timeout=10)
+            sol_response = SESSION.get(test_sol['catalog_url'], timeout=10)
             if sol_response.status_code == 200:
-                sol_data = sol_response.json()
+                sol_data = json_loads(sol_response.content)
                 print(f"✅ Sol {test_sol['sol']} catalog loaded!")
-                print(f"Keys in response: {list(sol_data.keys())}")
+                print(f"Keys in response: {', '.join(sol_data)}")
                 
                 if 'images' in sol_data:
                     images = sol_data['images']
@@ -54,8 +103,8 @@ try:
                         img = images[0]
                         print("Sample image data:")
                         for key, value in img.items():
-                            if isinstance(value, str) and len(str(value)) > 100:
-                                print(f"  {key}: {str(value)[:100]}...")
+                            if isinstance(value, str) and len(value) > 100:
+                                print(f"  {key}: {value[:100]}...")
                             else:
                                 print(f"  {key}: {value}")
             else:
@@ -67,22 +116,18 @@ print()
 print("=" * 70)
 print("3️⃣ Checking for Mars 2020 (Perseverance) equivalent...")
 
-# Try similar pattern for Mars 2020
-mars2020_patterns = [
-    "https://mars.nasa.gov/mars2020/multimedia/raw-images/image_manifest.json",
-    "https://mars.nasa.gov/mars2020-raw-images/image/image_manifest.json",
-    "https://mars.nasa.gov/mars2020/multimedia/raw-images/manifest.json",
-]
+# Try similar patterns for Mars 2020
+mars2020_patterns = MARS2020_CANDIDATES
 
 for url in mars2020_patterns:
     print(f"Testing: {url}")
     try:
-        response = requests.get(url, timeout=10)
+        response = SESSION.get(url, timeout=10)
         if response.status_code == 200:
             print(f"✅ Status: 200 - FOUND!")
             try:
-                data = response.json()
-                print(f"Keys: {list(data.keys())}")
+                data = json_loads(response.content)
+                print(f"Keys: {', '.join(data)}")
             except:
                 print(f"Not JSON, content-type: {response.headers.get('Content-Type')}")
         else:
@@ -2,7 +2,7 @@
 """
 Test multiple NASA API endpoints to find what works.
 """
-import requests
+from probe_utils import SESSION, fetch_all, json_loads
 
 API_KEY = "Whrc0fN97eqwSdCGpdgA4O9PVhvVVbBh3H3aMJtW"
 ROVER = "curiosity"
@@ -17,19 +17,29 @@ endpoints = [
 print("🔍 Testing NASA Mars Rover Photos API endpoints...")
 print()
 
-for name, url in endpoints:
+def fetch(item):
+    name, url = item
+    return SESSION.get(url, params={"api_key": API_KEY}, timeout=10)
+
+
+# All four endpoints are independent I/O waits — fan out, then print in
+# the original order so the output stays deterministic
+responses = fetch_all(fetch, endpoints, max_workers=len(endpoints))
+
+for (name, url), response in zip(endpoints, responses):
     print(f"Testing: {name}")
     print(f"URL: {url}")
-    
-    try:
-        response = requests.get(url, params={"api_key": API_KEY}, timeout=10)
+
+    if isinstance(response, Exception):
+        print(f"❌ Error: {response}")
+    else:
         print(f"Status: {response.status_code}")
-        
+
         if response.status_code == 200:
-            data = response.json()
+            data = json_loads(response.content)
             # Print first level keys
             print(f"✅ SUCCESS! Keys: {list(data.keys())}")
-            
+
             # Show count if available
             if 'photos' in data:
                 print(f"   Photos count: {len(data['photos'])}")
@@ -37,9 +47,6 @@ for name, url in endpoints:
                 print(f"   Latest photos count: {len(data['latest_photos'])}")
         else:
             print(f"❌ Failed - Status {response.status_code}")
-            
-    except Exception as e:
-        print(f"❌ Error: {e}")
-    
+
     print("-" * 60)
     print()
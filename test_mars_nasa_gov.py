@@ -2,44 +2,38 @@
 """
 Try to find mars.nasa.gov JSON API endpoints by testing common patterns.
 """
-import requests
-import json
+from probe_utils import SESSION, fetch_all, json_dumps, json_loads
+from test_urls import NASA_GOV_CANDIDATES, NASA_GOV_RSS_FEEDS
 
 # Common API endpoint patterns for mars.nasa.gov
-test_endpoints = [
-    # Try API subdomain
-    "https://api.mars.nasa.gov/mars2020/photos",
-    "https://api.mars.nasa.gov/mars2020/latest",
-    
-    # Try JSON endpoints under main domain
-    "https://mars.nasa.gov/api/v1/mars2020/photos",
-    "https://mars.nasa.gov/rss/api/?feed=raw_images&category=mars2020",
-    "https://mars.nasa.gov/msl-raw-images/image/image_manifest.json",
-    
-    # Try data subdomain
-    "https://data.mars.nasa.gov/mars2020/photos",
-    
-    # Try direct feed URLs
-    "https://mars.nasa.gov/rss/api/?feed=raw_images_mars2020",
-    "https://mars.nasa.gov/feeds/raw_images/?feedtype=json",
-]
+test_endpoints = NASA_GOV_CANDIDATES
 
 print("🔍 Searching for mars.nasa.gov JSON API Endpoints")
 print("=" * 70)
 print()
 
-for url in test_endpoints:
+def probe(url):
+    # HEAD first: only pull the body for confirmed JSON endpoints, so
+    # the common 404s cost a status line instead of a download
+    head = SESSION.head(url, allow_redirects=True, timeout=10)
+    if head.status_code == 200 and (
+        'json' in head.headers.get('Content-Type', '').lower() or url.endswith('.json')
+    ):
+        return SESSION.get(url, timeout=10)
+    return head
+
+
+# All endpoint probes fly in parallel; results print in list order
+responses = fetch_all(probe, test_endpoints)
+
+for url, response in zip(test_endpoints, responses):
     print(f"Testing: {url}")
-    
-    try:
-        # Try both GET with common params
-        response = requests.get(url, timeout=10, headers={
-            'User-Agent': 'Mozilla/5.0 (Python Requests)',
-            'Accept': 'application/json'
-        })
-        
+
+    if isinstance(response, Exception):
+        print(f"❌ Error: {type(response).__name__}")
+    else:
         print(f"Status: {response.status_code}")
-        
+
         if response.status_code == 200:
             content_type = response.headers.get('Content-Type', '')
             print(f"Content-Type: {content_type}")
@@ -47,9 +41,9 @@ for url in test_endpoints:
             if 'json' in content_type.lower() or url.endswith('.json'):
                 print("✅ JSON ENDPOINT FOUND!")
                 try:
-                    data = response.json()
+                    data = json_loads(response.content)
                     print(f"Response keys: {list(data.keys())}")
-                    print(f"Sample: {json.dumps(data, indent=2)[:500]}")
+                    print(f"Sample: {json_dumps(data)[:500]}")
                 except:
                     print(f"Response text: {response.text[:500]}")
             else:
@@ -60,32 +54,25 @@ for url in test_endpoints:
             print(f"🔀 Redirect to: {response.headers.get('Location')}")
         else:
             print(f"⚠️  Status {response.status_code}")
-            
-    except Exception as e:
-        print(f"❌ Error: {type(e).__name__}")
-    
+
     print()
 
 print("=" * 70)
 print("🔍 Checking for RSS/XML feeds (can be converted to JSON)")
 print()
 
-rss_feeds = [
-    "https://mars.nasa.gov/rss/api/?feed=raw_images&category=mars2020,msl",
-    "https://mars.nasa.gov/msl/multimedia/raw-images/rss.xml",
-    "https://mars.nasa.gov/mars2020/multimedia/raw-images/rss.xml",
-]
+rss_feeds = NASA_GOV_RSS_FEEDS
+
+rss_responses = fetch_all(lambda url: SESSION.get(url, timeout=10), rss_feeds)
 
-for url in rss_feeds:
+for url, response in zip(rss_feeds, rss_responses):
     print(f"Testing: {url}")
-    try:
-        response = requests.get(url, timeout=10)
-        if response.status_code == 200:
-            print(f"✅ Status: {response.status_code}")
-            print(f"Content-Type: {response.headers.get('Content-Type')}")
-            print(f"Length: {len(response.text)} bytes")
-        else:
-            print(f"Status: {response.status_code}")
-    except Exception as e:
-        print(f"Error: {e}")
+    if isinstance(response, Exception):
+        print(f"Error: {response}")
+    elif response.status_code == 200:
+        print(f"✅ Status: {response.status_code}")
+        print(f"Content-Type: {response.headers.get('Content-Type')}")
+        print(f"Length: {len(response.text)} bytes")
+    else:
+        print(f"Status: {response.status_code}")
     print()
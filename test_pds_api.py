@@ -2,8 +2,9 @@
 """
 Test PDS Imaging Atlas Search API to find Mars rover images.
 """
-import requests
-import json
+from itertools import islice
+
+from probe_utils import SESSION, json_dumps, json_loads
 
 # PDS Imaging Atlas Search API endpoint
 BASE_URL = "https://pds-imaging.jpl.nasa.gov/solr/pds_archives/select"
@@ -49,11 +50,11 @@ for query in test_queries:
     print()
     
     try:
-        response = requests.get(BASE_URL, params=query['params'], timeout=15)
+        response = SESSION.get(BASE_URL, params=query['params'], timeout=15)
         print(f"Status Code: {response.status_code}")
         
         if response.status_code == 200:
-            data = response.json()
+            data = json_loads(response.content)
             
             # Show response structure
             print(f"✅ SUCCESS!")
@@ -68,12 +69,12 @@ for query in test_queries:
                 if docs:
                     print("First result sample:")
                     first_doc = docs[0]
-                    for key, value in list(first_doc.items())[:10]:  # Show first 10 fields
+                    for key, value in islice(first_doc.items(), 10):  # Show first 10 fields
                         print(f"  {key}: {value}")
                     print()
             else:
-                print(f"Response keys: {list(data.keys())}")
-                print(json.dumps(data, indent=2)[:500])
+                print(f"Response keys: {', '.join(data)}")
+                print(json_dumps(data)[:500])
         else:
             print(f"❌ HTTP Error {response.status_code}")
             print(f"Response: {response.text[:300]}")
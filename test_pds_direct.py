@@ -2,7 +2,7 @@
 """
 Test direct PDS data access through file servers and ODE (Orbital Data Explorer).
 """
-import requests
+from probe_utils import SESSION
 
 endpoints = [
     {
@@ -36,7 +36,7 @@ for endpoint in endpoints:
     print(f"URL: {endpoint['url']}")
     
     try:
-        response = requests.head(endpoint['url'], timeout=10, allow_redirects=True)
+        response = SESSION.head(endpoint['url'], timeout=10, allow_redirects=True)
         status = response.status_code
         
         if status == 200:
@@ -63,7 +63,7 @@ test_query = {
 }
 
 try:
-    response = requests.get(ode_base, params=test_query, timeout=15)
+    response = SESSION.get(ode_base, params=test_query, timeout=15)
     print(f"Status: {response.status_code}")
     
     if response.status_code == 200:
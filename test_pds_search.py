@@ -2,8 +2,7 @@
 """
 Test PDS Search API (newer API for PDS4 data).
 """
-import requests
-import json
+from probe_utils import SESSION, fetch_all, json_dumps, json_loads
 
 # Try multiple PDS endpoints
 endpoints = [
@@ -37,31 +36,35 @@ print("🔍 Testing PDS Search APIs")
 print("=" * 70)
 print()
 
-for endpoint in endpoints:
+# Query all three APIs concurrently; results print in list order
+responses = fetch_all(
+    lambda endpoint: SESSION.get(endpoint['url'], params=endpoint.get('params'), timeout=15),
+    endpoints
+)
+
+for endpoint, response in zip(endpoints, responses):
     print(f"📡 API: {endpoint['name']}")
     print(f"URL: {endpoint['url']}")
     print(f"Params: {endpoint['params']}")
     print()
-    
-    try:
-        response = requests.get(endpoint['url'], params=endpoint.get('params'), timeout=15)
+
+    if isinstance(response, Exception):
+        print(f"❌ Error: {type(response).__name__}: {response}")
+    else:
         print(f"Status Code: {response.status_code}")
-        
+
         if response.status_code == 200:
             try:
-                data = response.json()
+                data = json_loads(response.content)
                 print(f"✅ SUCCESS!")
                 print(f"Response keys: {list(data.keys())}")
-                print(json.dumps(data, indent=2)[:800])
-            except json.JSONDecodeError:
+                print(json_dumps(data)[:800])
+            except ValueError:
                 print(f"Response (text): {response.text[:500]}")
         else:
             print(f"❌ HTTP Error {response.status_code}")
             print(f"Response: {response.text[:300]}")
-            
-    except Exception as e:
-        print(f"❌ Error: {type(e).__name__}: {e}")
-    
+
     print()
     print("-" * 70)
     print()
@@ -75,7 +78,7 @@ print()
 msl_url = "https://pds-geosciences.wustl.edu/msl/msl-m-mastcam-4-rdr-image-v1/mslmst_0001/"
 print(f"Testing MSL Data Access: {msl_url}")
 try:
-    response = requests.head(msl_url, timeout=10)
+    response = SESSION.head(msl_url, timeout=10)
     print(f"Status: {response.status_code}")
     if response.status_code == 200:
         print("✅ MSL data directory is accessible!")
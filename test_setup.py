@@ -1,9 +1,17 @@
 """
 Quick test script to verify the Mars Explorer Hub setup.
+
+By default, modules whose functions are not exercised are only located
+with importlib.util.find_spec, which avoids the multi-second cold import
+of Streamlit/pandas/Plotly. Pass --full to import everything for real.
 """
 
+import importlib.machinery
+import importlib.util
 import sys
 
+FULL_IMPORT = "--full" in sys.argv
+
 print("🔍 Testing Mars Explorer Hub Components...")
 print()
 
@@ -29,18 +37,29 @@ except Exception as e:
     print(f"   ❌ Error: {e}")
     sys.exit(1)
 
-# Test 3: Import NASA client
+# Test 3: NASA client module
 print()
 print("3️⃣ Testing NASA client module...")
 try:
-    from src.data.nasa_client import get_nasa_client
-    client = get_nasa_client()
-    print("   ✅ NASA client imported successfully")
+    if FULL_IMPORT:
+        from src.data.nasa_client import get_nasa_client
+        client = get_nasa_client()
+        print("   ✅ NASA client imported successfully")
+    else:
+        # find_spec("src.data.nasa_client") would execute src.data's
+        # __init__, which imports the full client stack — locate the
+        # module on the unexecuted package spec's path instead
+        pkg_spec = importlib.util.find_spec("src.data")
+        assert pkg_spec is not None
+        assert importlib.machinery.PathFinder.find_spec(
+            "nasa_client", pkg_spec.submodule_search_locations
+        ) is not None
+        print("   ✅ NASA client module found (pass --full to import it)")
 except Exception as e:
     print(f"   ❌ Error: {e}")
     sys.exit(1)
 
-# Test 4: Import utility functions
+# Test 4: Import utility functions (values are exercised, so import for real)
 print()
 print("4️⃣ Testing utility functions...")
 try:
@@ -54,27 +73,35 @@ except Exception as e:
     print(f"   ❌ Error: {e}")
     sys.exit(1)
 
-# Test 5: Import UI components
+# Test 5: UI components
 print()
 print("5️⃣ Testing UI components...")
 try:
-    from src.ui import (
-        render_weather_metrics,
-        render_temperature_chart,
-        render_photo_gallery,
-        render_rover_selector
-    )
-    print("   ✅ All UI components imported successfully")
+    if FULL_IMPORT:
+        from src.ui import (
+            render_weather_metrics,
+            render_temperature_chart,
+            render_photo_gallery,
+            render_rover_selector
+        )
+        print("   ✅ All UI components imported successfully")
+    else:
+        assert importlib.util.find_spec("src.ui") is not None
+        print("   ✅ UI module found (pass --full to import it)")
 except Exception as e:
     print(f"   ❌ Error: {e}")
     sys.exit(1)
 
-# Test 6: Import main app
+# Test 6: Main app module
 print()
 print("6️⃣ Testing main app module...")
 try:
-    import app
-    print("   ✅ Main app module imported successfully")
+    if FULL_IMPORT:
+        import app
+        print("   ✅ Main app module imported successfully")
+    else:
+        assert importlib.util.find_spec("app") is not None
+        print("   ✅ Main app module found (pass --full to import it)")
 except Exception as e:
     print(f"   ❌ Error: {e}")
     sys.exit(1)
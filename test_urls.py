@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Shared URL constants for the API discovery scripts.
+
+The MSL manifest and the Mars 2020 candidate patterns were duplicated
+across several scripts, so running the suite probed the same URLs
+multiple times. With one source of truth (and the cached probe session)
+each unique URL is hit once per TTL window.
+"""
+
+MSL_MANIFEST = "https://mars.nasa.gov/msl-raw-images/image/image_manifest.json"
+
+# Candidate Mars 2020/Perseverance manifest locations, based on the MSL
+# /msl-raw-images/ pattern (none confirmed so far)
+MARS2020_CANDIDATES = (
+    # Direct variations
+    "https://mars.nasa.gov/m2020-raw-images/image/image_manifest.json",
+    "https://mars.nasa.gov/mars2020-images/image/image_manifest.json",
+    "https://mars.nasa.gov/perseverance-raw-images/image/image_manifest.json",
+    "https://mars.nasa.gov/mars2020-raw-images/image/image_manifest.json",
+
+    # Under multimedia
+    "https://mars.nasa.gov/mars2020/multimedia/raw/image_manifest.json",
+    "https://mars.nasa.gov/mars2020/multimedia/images/image_manifest.json",
+    "https://mars.nasa.gov/mars2020/multimedia/raw-images/image_manifest.json",
+    "https://mars.nasa.gov/mars2020/multimedia/raw-images/manifest.json",
+
+    # Try direct API calls like MSL
+    "https://mars.nasa.gov/mars2020/images/image_manifest.json",
+
+    # Check other mission patterns
+    "https://mars.nasa.gov/mer-raw-images/image/image_manifest.json",  # MER (Opportunity/Spirit)
+    "https://mars.nasa.gov/msl/multimedia/raw-images/image_manifest.json",
+)
+
+# Candidate mars.nasa.gov JSON API endpoints
+NASA_GOV_CANDIDATES = (
+    # Try API subdomain
+    "https://api.mars.nasa.gov/mars2020/photos",
+    "https://api.mars.nasa.gov/mars2020/latest",
+
+    # Try JSON endpoints under main domain
+    "https://mars.nasa.gov/api/v1/mars2020/photos",
+    "https://mars.nasa.gov/rss/api/?feed=raw_images&category=mars2020",
+    MSL_MANIFEST,
+
+    # Try data subdomain
+    "https://data.mars.nasa.gov/mars2020/photos",
+
+    # Try direct feed URLs
+    "https://mars.nasa.gov/rss/api/?feed=raw_images_mars2020",
+    "https://mars.nasa.gov/feeds/raw_images/?feedtype=json",
+)
+
+# RSS/XML feed candidates (convertible to JSON)
+NASA_GOV_RSS_FEEDS = (
+    "https://mars.nasa.gov/rss/api/?feed=raw_images&category=mars2020,msl",
+    "https://mars.nasa.gov/msl/multimedia/raw-images/rss.xml",
+    "https://mars.nasa.gov/mars2020/multimedia/raw-images/rss.xml",
+)